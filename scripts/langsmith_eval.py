@@ -18,6 +18,7 @@ Usage:
 
 import argparse
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from langchain_anthropic import ChatAnthropic
@@ -26,6 +27,9 @@ from langsmith import Client
 from langsmith.evaluation import evaluate
 
 DATASET_NAME = "beneissue-triage-test"
+DECISION_MAX_TOKENS = 10
+# Examples are independent, so evaluate several at once instead of in series
+EVAL_MAX_CONCURRENCY = 4
 
 
 def load_triage_cases() -> list[dict]:
@@ -61,14 +65,9 @@ def upload_dataset(client: Client, cases: list[dict]) -> None:
     except Exception:
         pass
 
-    # Create new dataset
+    # Create new dataset and upload all examples in a single request
     dataset = client.create_dataset(DATASET_NAME)
-    for case in cases:
-        client.create_example(
-            inputs=case["inputs"],
-            outputs=case["outputs"],
-            dataset_id=dataset.id,
-        )
+    client.create_examples(dataset_id=dataset.id, examples=cases)
 
     print(f"Created dataset: {dataset.url}")
 
@@ -88,16 +87,23 @@ def run_eval(client: Client) -> None:
         data=DATASET_NAME,
         evaluators=[check_decision],
         experiment_prefix="triage-v1",
+        max_concurrency=EVAL_MAX_CONCURRENCY,
+        client=client,
     )
 
     print(f"\nExperiment: {results.experiment_name}")
     print("View results at: https://smith.langchain.com")
 
 
+@lru_cache(maxsize=1)
+def get_llm() -> ChatAnthropic:
+    """Get a shared LLM client so all examples reuse one connection pool."""
+    # Only a single-word decision is needed, so cap the response size
+    return ChatAnthropic(model="claude-haiku-4-5", max_tokens=DECISION_MAX_TOKENS)
+
+
 def triage(inputs: dict) -> dict:
     """Simple triage function."""
-    llm = ChatAnthropic(model="claude-haiku-4-5")
-
     # Build prompt with existing issues if present
     content = f"Title: {inputs['title']}\n\nBody: {inputs['body']}"
     if "existing_issues" in inputs:
@@ -107,7 +113,7 @@ def triage(inputs: dict) -> dict:
         )
         content += f"\n\nExisting Issues:\n{issues_text}"
 
-    response = llm.invoke([
+    response = get_llm().invoke([
         SystemMessage(
             content="You are a GitHub issue triage bot. "
             "Respond with ONLY one word: valid, invalid, duplicate, or needs_info"
@@ -744,6 +744,7 @@ def _run_test_case(test_case: dict, project_root: Path) -> dict:
     import logging
 
     from beneissue.metrics.collector import (
+        flush_metrics_node,
         record_analyze_metrics_node,
         record_triage_metrics_node,
     )
@@ -859,6 +860,7 @@ def _run_test_case(test_case: dict, project_root: Path) -> dict:
             record_triage_metrics_node(state)
         elif stage == "analyze":
             record_analyze_metrics_node(state)
+        flush_metrics_node(state)
 
         return {"passed": True, "reason": ""}
 
@@ -43,7 +43,7 @@ DEFAULT_DAILY_LIMIT_FIX = 5
 CONFIG_PATH = ".claude/skills/beneissue/beneissue-config.yml"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScoringCriteria:
     """Scoring criteria weights."""
 
@@ -53,7 +53,7 @@ class ScoringCriteria:
     clarity: int = 15
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScoringConfig:
     """Auto-fix scoring configuration."""
 
@@ -61,16 +61,16 @@ class ScoringConfig:
     criteria: ScoringCriteria = field(default_factory=ScoringCriteria)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TeamMember:
     """Team member for assignee recommendation."""
 
     github_id: str = ""
     available: bool = True
-    specialties: list[str] = field(default_factory=list)
+    specialties: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True)
 class DailyLimitsConfig:
     """Daily rate limits for cost control."""
 
@@ -83,7 +83,7 @@ class DailyLimitsConfig:
 DEFAULT_LANGSMITH_PROJECT = "beneissue"
 
 
-@dataclass
+@dataclass(frozen=True)
 class LabelDef:
     """Label definition."""
 
@@ -92,54 +92,57 @@ class LabelDef:
     description: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class LabelsConfig:
     """Labels configuration."""
 
-    action: list[LabelDef] = field(default_factory=list)
-    triage: list[LabelDef] = field(default_factory=list)
-    type: list[LabelDef] = field(default_factory=list)
-    priority: list[LabelDef] = field(default_factory=list)
-    story_points: list[LabelDef] = field(default_factory=list)
-    contribution: list[LabelDef] = field(default_factory=list)
+    action: tuple[LabelDef, ...] = ()
+    triage: tuple[LabelDef, ...] = ()
+    type: tuple[LabelDef, ...] = ()
+    priority: tuple[LabelDef, ...] = ()
+    story_points: tuple[LabelDef, ...] = ()
+    contribution: tuple[LabelDef, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True)
 class LimitsConfig:
     """Limits configuration."""
 
     daily: DailyLimitsConfig = field(default_factory=DailyLimitsConfig)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BeneissueConfig:
     """Main configuration class."""
 
     version: str = "1.0"
     scoring: ScoringConfig = field(default_factory=ScoringConfig)
-    team: list[TeamMember] = field(default_factory=list)
+    team: tuple[TeamMember, ...] = ()
     limits: LimitsConfig = field(default_factory=LimitsConfig)
     labels: LabelsConfig = field(default_factory=LabelsConfig)
 
 
-def _parse_team(data: list[dict]) -> list[TeamMember]:
+# Shared defaults returned when there is no config file or env override.
+# The config dataclasses are frozen, so one instance is safe to share.
+_DEFAULT_CONFIG = BeneissueConfig()
+
+
+def _parse_team(data: list[dict]) -> tuple[TeamMember, ...]:
     """Parse team configuration."""
-    team = []
-    for member in data:
-        if member.get("github_id"):  # Skip empty entries
-            team.append(
-                TeamMember(
-                    github_id=member.get("github_id", ""),
-                    available=member.get("available", True),
-                    specialties=member.get("specialties", []),
-                )
-            )
-    return team
+    return tuple(
+        TeamMember(
+            github_id=member.get("github_id", ""),
+            available=member.get("available", True),
+            specialties=tuple(member.get("specialties", ())),
+        )
+        for member in data
+        if member.get("github_id")  # Skip empty entries
+    )
 
 
-def _parse_labels(data: list[dict]) -> list[LabelDef]:
+def _parse_labels(data: list[dict]) -> tuple[LabelDef, ...]:
     """Parse label definitions."""
-    return [
+    return tuple(
         LabelDef(
             name=label.get("name", ""),
             color=label.get("color", ""),
@@ -147,7 +150,7 @@ def _parse_labels(data: list[dict]) -> list[LabelDef]:
         )
         for label in data
         if label.get("name")
-    ]
+    )
 
 
 def load_config(repo_path: Optional[Path] = None) -> BeneissueConfig:
@@ -162,73 +165,72 @@ def load_config(repo_path: Optional[Path] = None) -> BeneissueConfig:
         repo_path: Path to repository root. Defaults to current directory.
 
     Returns:
-        BeneissueConfig instance
+        Frozen BeneissueConfig instance. When neither a config file nor an
+        env override is present, a shared defaults instance is returned.
     """
-    config = BeneissueConfig()
-
-    # Load from config file if exists
     if repo_path is None:
         repo_path = Path.cwd()
 
     config_file = repo_path / CONFIG_PATH
-    if config_file.exists():
+    has_config_file = os.path.exists(config_file)
+    env_threshold = os.environ.get("BENEISSUE_SCORE_THRESHOLD")
+
+    # Fast path: nothing to apply on top of the defaults
+    if not has_config_file and not env_threshold:
+        return _DEFAULT_CONFIG
+
+    data: dict = {}
+
+    # Load from config file if exists
+    if has_config_file:
         with open(config_file) as f:
             data = yaml.safe_load(f) or {}
 
-        # Parse scoring
-        if "scoring" in data:
-            config.scoring.threshold = data["scoring"].get(
-                "threshold", DEFAULT_SCORE_THRESHOLD
-            )
-            if "criteria" in data["scoring"]:
-                criteria = data["scoring"]["criteria"]
-                config.scoring.criteria.scope = criteria.get("scope", {}).get(
-                    "weight", 30
-                )
-                config.scoring.criteria.risk = criteria.get("risk", {}).get(
-                    "weight", 30
-                )
-                config.scoring.criteria.verifiability = criteria.get(
-                    "verifiability", {}
-                ).get("weight", 25)
-                config.scoring.criteria.clarity = criteria.get("clarity", {}).get(
-                    "weight", 15
-                )
-
-        # Parse team
-        if "team" in data and isinstance(data["team"], list):
-            config.team = _parse_team(data["team"])
-
-        # Parse limits
-        if "limits" in data and "daily" in data["limits"]:
-            daily = data["limits"]["daily"]
-            config.limits.daily.triage = daily.get("triage", DEFAULT_DAILY_LIMIT_TRIAGE)
-            config.limits.daily.analyze = daily.get(
-                "analyze", DEFAULT_DAILY_LIMIT_ANALYZE
-            )
-            config.limits.daily.fix = daily.get("fix", DEFAULT_DAILY_LIMIT_FIX)
-
-        # Parse labels
-        if "labels" in data:
-            labels_data = data["labels"]
-            if "action" in labels_data:
-                config.labels.action = _parse_labels(labels_data["action"])
-            if "triage" in labels_data:
-                config.labels.triage = _parse_labels(labels_data["triage"])
-            if "type" in labels_data:
-                config.labels.type = _parse_labels(labels_data["type"])
-            if "priority" in labels_data:
-                config.labels.priority = _parse_labels(labels_data["priority"])
-            if "story_points" in labels_data:
-                config.labels.story_points = _parse_labels(labels_data["story_points"])
-            if "contribution" in labels_data:
-                config.labels.contribution = _parse_labels(labels_data["contribution"])
+    # Parse scoring
+    scoring = data.get("scoring", {})
+    criteria = scoring.get("criteria", {})
+    threshold = scoring.get("threshold", DEFAULT_SCORE_THRESHOLD)
 
     # Override with environment variables
-    if env_threshold := os.environ.get("BENEISSUE_SCORE_THRESHOLD"):
-        config.scoring.threshold = int(env_threshold)
-
-    return config
+    if env_threshold:
+        threshold = int(env_threshold)
+
+    # Parse team
+    team = data.get("team")
+
+    # Parse limits
+    daily = data.get("limits", {}).get("daily", {})
+
+    # Parse labels
+    labels_data = data.get("labels", {})
+
+    return BeneissueConfig(
+        scoring=ScoringConfig(
+            threshold=threshold,
+            criteria=ScoringCriteria(
+                scope=criteria.get("scope", {}).get("weight", 30),
+                risk=criteria.get("risk", {}).get("weight", 30),
+                verifiability=criteria.get("verifiability", {}).get("weight", 25),
+                clarity=criteria.get("clarity", {}).get("weight", 15),
+            ),
+        ),
+        team=_parse_team(team) if isinstance(team, list) else (),
+        limits=LimitsConfig(
+            daily=DailyLimitsConfig(
+                triage=daily.get("triage", DEFAULT_DAILY_LIMIT_TRIAGE),
+                analyze=daily.get("analyze", DEFAULT_DAILY_LIMIT_ANALYZE),
+                fix=daily.get("fix", DEFAULT_DAILY_LIMIT_FIX),
+            )
+        ),
+        labels=LabelsConfig(
+            action=_parse_labels(labels_data.get("action", [])),
+            triage=_parse_labels(labels_data.get("triage", [])),
+            type=_parse_labels(labels_data.get("type", [])),
+            priority=_parse_labels(labels_data.get("priority", [])),
+            story_points=_parse_labels(labels_data.get("story_points", [])),
+            contribution=_parse_labels(labels_data.get("contribution", [])),
+        ),
+    )
 
 
 def get_available_assignee(
@@ -2,26 +2,38 @@
 
 from beneissue.graph.state import IssueState
 
-
-def route_after_intake(state: IssueState) -> str:
-    """Route after intake node - check daily limit before proceeding."""
-    if state.get("daily_limit_exceeded"):
-        return "limit_exceeded"
-    return "continue"
+# Next node per triage decision; anything else goes to apply_labels
+_TRIAGE_ROUTES = {
+    "valid": "analyze",
+    # needs_info requires posting questions as a comment
+    "needs_info": "post_comment",
+    "invalid": "apply_labels",
+    "duplicate": "apply_labels",
+}
+
+# Next node per fix decision when no fix was requested
+_ANALYZE_ROUTES = {
+    "auto_eligible": "post_comment",
+    "manual_required": "post_comment",
+    "comment_only": "post_comment",
+}
+
+# Test workflow has no apply_labels; only valid issues continue
+_TRIAGE_TEST_ROUTES = {"valid": "analyze"}
+
+
+def route_after_intake(state: IssueState) -> bool:
+    """Route after intake node - check daily limit before proceeding.
+
+    Returns whether the limit was exceeded; the graph maps True to
+    limit_exceeded and False to the workflow's first step.
+    """
+    return bool(state.get("daily_limit_exceeded"))
 
 
 def route_after_triage(state: IssueState) -> str:
     """Route after triage node based on decision."""
-    match state.get("triage_decision"):
-        case "valid":
-            return "analyze"
-        case "needs_info":
-            # needs_info requires posting questions as a comment
-            return "post_comment"
-        case "invalid" | "duplicate":
-            return "apply_labels"
-        case _:
-            return "apply_labels"
+    return _TRIAGE_ROUTES.get(state.get("triage_decision"), "apply_labels")
 
 
 def route_after_analyze(state: IssueState) -> str:
@@ -34,25 +46,18 @@ def route_after_analyze(state: IssueState) -> str:
     This ensures auto-eligible issues still require human approval via @beneissue fix.
     """
     fix_decision = state.get("fix_decision")
-    command = state.get("command")
 
     # Only proceed to fix if explicitly requested via @beneissue fix
-    if fix_decision == "auto_eligible" and command == "fix":
+    if fix_decision == "auto_eligible" and state.get("command") == "fix":
         return "fix"
 
     # All other cases: post comment or apply labels
-    if fix_decision in ("auto_eligible", "manual_required", "comment_only"):
-        return "post_comment"
-
-    return "apply_labels"
+    return _ANALYZE_ROUTES.get(fix_decision, "apply_labels")
 
 
 def route_after_fix(state: IssueState) -> str:
     """Route after fix node based on success."""
-    if state.get("fix_success"):
-        return "apply_labels"
-    else:
-        return "post_comment"
+    return "apply_labels" if state.get("fix_success") else "post_comment"
 
 
 def route_after_triage_test(state: IssueState) -> str:
@@ -61,6 +66,4 @@ def route_after_triage_test(state: IssueState) -> str:
     Routes to analyze if valid, otherwise ends the workflow.
     Used by test_full_graph for LangSmith Studio testing.
     """
-    if state.get("triage_decision") == "valid":
-        return "analyze"
-    return "__end__"
+    return _TRIAGE_TEST_ROUTES.get(state.get("triage_decision"), "__end__")
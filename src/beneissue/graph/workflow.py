@@ -17,6 +17,7 @@ from beneissue.graph.routing import (
 )
 from beneissue.graph.state import IssueState
 from beneissue.metrics.collector import (
+    flush_metrics_node,
     record_analyze_metrics_node,
     record_fix_metrics_node,
     record_triage_metrics_node,
@@ -39,7 +40,7 @@ ANALYZE_CACHE_POLICY = CachePolicy(ttl=3600)
 
 
 def _build_triage_graph(*, enable_cache: bool = False) -> StateGraph:
-    """Build triage-only graph: intake → triage → record_triage_metrics → apply_labels."""
+    """Build triage-only graph: intake → triage → record_triage_metrics → apply_labels → flush_metrics."""
     workflow = StateGraph(IssueState)
 
     workflow.add_node("intake", intake_node)
@@ -51,6 +52,7 @@ def _build_triage_graph(*, enable_cache: bool = False) -> StateGraph:
     )
     workflow.add_node("record_triage_metrics", record_triage_metrics_node)
     workflow.add_node("apply_labels", apply_labels_node)
+    workflow.add_node("flush_metrics", flush_metrics_node)
 
     workflow.set_entry_point("intake")
 
@@ -59,15 +61,16 @@ def _build_triage_graph(*, enable_cache: bool = False) -> StateGraph:
         "intake",
         route_after_intake,
         {
-            "limit_exceeded": "limit_exceeded",
-            "continue": "triage",
+            True: "limit_exceeded",
+            False: "triage",
         },
     )
 
     workflow.add_edge("limit_exceeded", END)
     workflow.add_edge("triage", "record_triage_metrics")
     workflow.add_edge("record_triage_metrics", "apply_labels")
-    workflow.add_edge("apply_labels", END)
+    workflow.add_edge("apply_labels", "flush_metrics")
+    workflow.add_edge("flush_metrics", END)
 
     return workflow
 
@@ -89,7 +92,7 @@ def create_triage_workflow(
 
 
 def _build_analyze_graph(*, enable_cache: bool = False) -> StateGraph:
-    """Build analyze-only graph: intake → analyze → record_analyze_metrics → post_comment → apply_labels."""
+    """Build analyze-only graph: intake → analyze → record_analyze_metrics → post_comment → apply_labels → flush_metrics."""
     workflow = StateGraph(IssueState)
 
     workflow.add_node("intake", intake_node)
@@ -102,6 +105,7 @@ def _build_analyze_graph(*, enable_cache: bool = False) -> StateGraph:
     workflow.add_node("record_analyze_metrics", record_analyze_metrics_node)
     workflow.add_node("post_comment", post_comment_node)
     workflow.add_node("apply_labels", apply_labels_node)
+    workflow.add_node("flush_metrics", flush_metrics_node)
 
     workflow.set_entry_point("intake")
 
@@ -110,8 +114,8 @@ def _build_analyze_graph(*, enable_cache: bool = False) -> StateGraph:
         "intake",
         route_after_intake,
         {
-            "limit_exceeded": "limit_exceeded",
-            "continue": "analyze",
+            True: "limit_exceeded",
+            False: "analyze",
         },
     )
 
@@ -121,7 +125,8 @@ def _build_analyze_graph(*, enable_cache: bool = False) -> StateGraph:
     workflow.add_edge("analyze", "record_analyze_metrics")
     workflow.add_edge("record_analyze_metrics", "post_comment")
     workflow.add_edge("post_comment", "apply_labels")
-    workflow.add_edge("apply_labels", END)
+    workflow.add_edge("apply_labels", "flush_metrics")
+    workflow.add_edge("flush_metrics", END)
 
     return workflow
 
@@ -143,7 +148,7 @@ def create_analyze_workflow(
 
 
 def _build_fix_graph() -> StateGraph:
-    """Build fix-only graph: intake → fix → record_fix_metrics → post_comment/apply_labels."""
+    """Build fix-only graph: intake → fix → record_fix_metrics → post_comment/apply_labels → flush_metrics."""
     workflow = StateGraph(IssueState)
 
     workflow.add_node("intake", intake_node)
@@ -152,6 +157,7 @@ def _build_fix_graph() -> StateGraph:
     workflow.add_node("record_fix_metrics", record_fix_metrics_node)
     workflow.add_node("post_comment", post_comment_node)
     workflow.add_node("apply_labels", apply_labels_node)
+    workflow.add_node("flush_metrics", flush_metrics_node)
 
     workflow.set_entry_point("intake")
 
@@ -160,8 +166,8 @@ def _build_fix_graph() -> StateGraph:
         "intake",
         route_after_intake,
         {
-            "limit_exceeded": "limit_exceeded",
-            "continue": "fix",
+            True: "limit_exceeded",
+            False: "fix",
         },
     )
 
@@ -180,7 +186,8 @@ def _build_fix_graph() -> StateGraph:
     )
 
     workflow.add_edge("post_comment", "apply_labels")
-    workflow.add_edge("apply_labels", END)
+    workflow.add_edge("apply_labels", "flush_metrics")
+    workflow.add_edge("flush_metrics", END)
 
     return workflow
 
@@ -199,7 +206,8 @@ def create_fix_workflow(
 def _build_full_graph(*, enable_cache: bool = False) -> StateGraph:
     """Build the full graph with triage, analyze, fix, and actions.
 
-    Each step records its own metrics immediately after completion.
+    Each step buffers its own metrics immediately after completion; they are
+    saved in one batch by flush_metrics at the end of the workflow.
     """
     workflow = StateGraph(IssueState)
 
@@ -222,6 +230,7 @@ def _build_full_graph(*, enable_cache: bool = False) -> StateGraph:
     workflow.add_node("record_fix_metrics", record_fix_metrics_node)
     workflow.add_node("apply_labels", apply_labels_node)
     workflow.add_node("post_comment", post_comment_node)
+    workflow.add_node("flush_metrics", flush_metrics_node)
 
     # Define edges
     workflow.set_entry_point("intake")
@@ -231,8 +240,8 @@ def _build_full_graph(*, enable_cache: bool = False) -> StateGraph:
         "intake",
         route_after_intake,
         {
-            "limit_exceeded": "limit_exceeded",
-            "continue": "triage",
+            True: "limit_exceeded",
+            False: "triage",
         },
     )
 
@@ -280,7 +289,8 @@ def _build_full_graph(*, enable_cache: bool = False) -> StateGraph:
     )
 
     # Terminal edges
-    workflow.add_edge("apply_labels", END)
+    workflow.add_edge("apply_labels", "flush_metrics")
+    workflow.add_edge("flush_metrics", END)
     workflow.add_edge("post_comment", "apply_labels")
 
     return workflow
@@ -309,7 +319,7 @@ def create_full_workflow(
 
 
 def _build_test_full_graph(*, enable_cache: bool = False) -> StateGraph:
-    """Build test graph: load_preset → triage → record_triage_metrics → analyze → record_analyze_metrics → END.
+    """Build test graph: load_preset → triage → record_triage_metrics → analyze → record_analyze_metrics → flush_metrics.
 
     This graph is designed for LangSmith Studio testing without GitHub dependencies.
     Uses configurable preset_name to load test cases from JSON files.
@@ -330,24 +340,26 @@ def _build_test_full_graph(*, enable_cache: bool = False) -> StateGraph:
         cache_policy=ANALYZE_CACHE_POLICY if enable_cache else None,
     )
     workflow.add_node("record_analyze_metrics", record_analyze_metrics_node)
+    workflow.add_node("flush_metrics", flush_metrics_node)
 
     # Define edges
     workflow.set_entry_point("load_preset")
     workflow.add_edge("load_preset", "triage")
     workflow.add_edge("triage", "record_triage_metrics")
 
-    # Conditional routing: valid → analyze, else → END
+    # Conditional routing: valid → analyze, else → flush metrics and end
     workflow.add_conditional_edges(
         "record_triage_metrics",
         route_after_triage_test,
         {
             "analyze": "analyze",
-            END: END,
+            END: "flush_metrics",
         },
     )
 
     workflow.add_edge("analyze", "record_analyze_metrics")
-    workflow.add_edge("record_analyze_metrics", END)
+    workflow.add_edge("record_analyze_metrics", "flush_metrics")
+    workflow.add_edge("flush_metrics", END)
 
     return workflow
 
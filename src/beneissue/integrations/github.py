@@ -232,11 +232,9 @@ def get_analysis_comment(repo: str, issue_number: int) -> dict | None:
     repository = gh.get_repo(repo)
     issue = repository.get_issue(issue_number)
 
-    # Get comments in reverse order (most recent first)
-    comments = list(issue.get_comments())
-    comments.reverse()
-
-    for comment in comments:
+    # Stream comments most recent first; pages are fetched lazily from the end,
+    # so we stop paging as soon as the latest analysis comment is found
+    for comment in issue.get_comments().reversed:
         body = comment.body or ""
         if ANALYSIS_MARKER not in body:
             continue
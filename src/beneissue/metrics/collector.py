@@ -1,40 +1,141 @@
 """Metrics collector for workflow runs."""
 
+import atexit
 import logging
+import os
+import queue
+import threading
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from typing import Final, Optional
 
 from beneissue.graph.state import IssueState
-from beneissue.metrics.schemas import WorkflowRunRecord
+from beneissue.metrics.schemas import WorkflowRunRecord, WorkflowType
 from beneissue.metrics.storage import get_storage
 
 logger = logging.getLogger("beneissue.metrics")
 
-StepType = Literal["triage", "analyze", "fix"]
+StepType = WorkflowType
+
+# Result fields copied from state for each step; the rest stay None
+_STEP_FIELDS: dict[str, tuple[str, ...]] = {
+    "triage": ("triage_decision", "triage_reason", "duplicate_of"),
+    "analyze": ("fix_decision", "priority", "story_points", "assignee"),
+    "fix": ("fix_success", "pr_url", "fix_error"),
+}
+
+# Shared "no state update" node result; LangGraph only reads it
+_NO_UPDATE: Final[dict] = {}
+
+# Maximum number of queued batches merged into a single insert
+MAX_QUEUED_BATCHES = 16
 
 
 class MetricsCollector:
-    """Collects and stores workflow metrics."""
+    """Collects workflow metrics and stores them in one batch per workflow.
 
-    def record_step(
-        self, state: IssueState, step_type: StepType
-    ) -> Optional[str]:
-        """Record a completed step to storage.
+    Inserts run on a background thread so the workflow never waits on
+    Supabase. Buffered records and queued batches are saved at interpreter
+    exit, so steps recorded before a later node fails are not lost.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[WorkflowRunRecord] = []
+        # Guards _pending; one collector is shared by concurrent graph runs
+        self._pending_lock = threading.Lock()
+        self._exit_hook_registered = False
+        self._queue: queue.Queue[list[WorkflowRunRecord]] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def record_step(self, state: IssueState, step_type: StepType) -> bool:
+        """Buffer a completed step until the next flush().
 
         Args:
             state: Current workflow state after step completion
             step_type: Which step completed (triage, analyze, or fix)
 
         Returns:
-            Record ID if saved successfully, None otherwise
+            True if the step was buffered, False if storage is not configured
         """
         storage = get_storage()
         if not storage.is_configured:
             logger.debug("Metrics storage not configured, skipping")
-            return None
+            return False
 
         record = self._state_to_record(state, step_type)
-        return storage.save_run(record)
+        with self._pending_lock:
+            self._pending.append(record)
+            if not self._exit_hook_registered:
+                # Save records left unflushed (e.g. a later node raised)
+                atexit.register(self._flush_at_exit)
+                self._exit_hook_registered = True
+        return True
+
+    def flush(self, wait: bool = False) -> None:
+        """Hand all buffered records to the background writer as one batch.
+
+        Args:
+            wait: Block until every queued batch has been saved
+        """
+        with self._pending_lock:
+            records, self._pending = self._pending, []
+
+        if records:
+            self._ensure_worker()
+            self._queue.put_nowait(records)
+
+        if wait and self._worker is not None:
+            self._queue.join()
+
+    def _flush_at_exit(self) -> None:
+        """Save everything still buffered or queued before the process exits.
+
+        Records buffered without a flush (e.g. a later node raised) are saved
+        on this thread, since new threads may not start during shutdown.
+        """
+        with self._pending_lock:
+            records, self._pending = self._pending, []
+
+        if self._worker is not None:
+            if records:
+                self._queue.put_nowait(records)
+            self._queue.join()
+        elif records:
+            self._save(records)
+
+    def _ensure_worker(self) -> None:
+        """Start the background writer thread on first use."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain, name="beneissue-metrics", daemon=True
+                )
+                self._worker.start()
+
+    def _drain(self) -> None:
+        """Save queued batches, merging any that are already waiting."""
+        while True:
+            batches = [self._queue.get()]
+            while len(batches) < MAX_QUEUED_BATCHES:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._save([record for batch in batches for record in batch])
+            finally:
+                for _ in batches:
+                    self._queue.task_done()
+
+    def _save(self, records: list[WorkflowRunRecord]) -> None:
+        """Save records in one insert, logging (never raising) on failure."""
+        try:
+            record_ids = get_storage().save_runs(records)
+            if record_ids:
+                logger.info("Recorded metrics: %s", record_ids)
+        except Exception as e:
+            logger.error("Metrics writer failed: %s", e)
 
     def _state_to_record(
         self, state: IssueState, step_type: StepType
@@ -42,7 +143,7 @@ class MetricsCollector:
         """Convert IssueState to WorkflowRunRecord for a specific step."""
         now = datetime.now(timezone.utc)
 
-        return WorkflowRunRecord(
+        fields = dict(
             # Identification
             repo=state.get("repo", ""),
             issue_number=state.get("issue_number", 0),
@@ -51,23 +152,18 @@ class MetricsCollector:
             issue_created_at=state.get("issue_created_at"),
             workflow_started_at=state.get("workflow_started_at", now),
             workflow_completed_at=now,
-            # Triage results (only populated for triage step)
-            triage_decision=state.get("triage_decision") if step_type == "triage" else None,
-            triage_reason=state.get("triage_reason") if step_type == "triage" else None,
-            duplicate_of=state.get("duplicate_of") if step_type == "triage" else None,
-            # Analyze results (only populated for analyze step)
-            fix_decision=state.get("fix_decision") if step_type == "analyze" else None,
-            priority=state.get("priority") if step_type == "analyze" else None,
-            story_points=state.get("story_points") if step_type == "analyze" else None,
-            assignee=state.get("assignee") if step_type == "analyze" else None,
-            # Fix results (only populated for fix step)
-            fix_success=state.get("fix_success") if step_type == "fix" else None,
-            pr_url=state.get("pr_url") if step_type == "fix" else None,
-            fix_error=state.get("fix_error") if step_type == "fix" else None,
+            # Step results (only the completed step's fields are populated)
+            **{field: state.get(field) for field in _STEP_FIELDS[step_type]},
             # Token usage (extracted from usage_metadata)
             **self._extract_token_fields(state),
         )
 
+        skip = os.environ.get("BENEISSUE_SKIP_METRICS_VALIDATION", "false").lower()
+        if skip in ("true", "1", "yes"):
+            # Opt-in fast path: trust the state and skip re-validation
+            return WorkflowRunRecord.model_construct(**fields)
+        return WorkflowRunRecord(**fields)
+
     def _extract_token_fields(self, state: IssueState) -> dict:
         """Extract token fields from usage_metadata for DB storage."""
         usage = state.get("usage_metadata", {})
@@ -99,7 +195,7 @@ def _record_step(state: IssueState, step_type: StepType) -> dict:
     """Internal helper to record a step's metrics."""
     if state.get("dry_run"):
         logger.debug("Dry run mode, skipping metrics for %s", step_type)
-        return {}
+        return _NO_UPDATE
 
     usage = state.get("usage_metadata", {})
     logger.debug(
@@ -110,10 +206,8 @@ def _record_step(state: IssueState, step_type: StepType) -> dict:
     )
 
     collector = get_collector()
-    record_id = collector.record_step(state, step_type)
-
-    if record_id:
-        logger.info("Recorded %s metrics: %s", step_type, record_id)
+    if collector.record_step(state, step_type):
+        logger.info("Buffered %s metrics", step_type)
 
     # Clear usage_metadata after recording so next step starts fresh
     return {"usage_metadata": {}}
@@ -132,3 +226,12 @@ def record_analyze_metrics_node(state: IssueState) -> dict:
 def record_fix_metrics_node(state: IssueState) -> dict:
     """LangGraph node to record fix step metrics."""
     return _record_step(state, "fix")
+
+
+def flush_metrics_node(state: IssueState) -> dict:
+    """LangGraph node to save all buffered step metrics in one batch.
+
+    Does not wait for the insert; the background writer saves it.
+    """
+    get_collector().flush()
+    return _NO_UPDATE
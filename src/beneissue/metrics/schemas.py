@@ -3,16 +3,25 @@
 from datetime import datetime
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Closed value sets for the columns that only take known values
+WorkflowType = Literal["triage", "analyze", "fix"]
+TriageDecision = Literal["valid", "invalid", "duplicate", "needs_info"]
+FixDecision = Literal["auto_eligible", "manual_required", "comment_only"]
+Priority = Literal["P0", "P1", "P2"]
+StoryPoints = Literal[1, 2, 3, 5, 8]
 
 
 class WorkflowRunRecord(BaseModel):
     """Record of a single step execution (triage, analyze, or fix)."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Identification
     repo: str
     issue_number: int
-    workflow_type: Literal["triage", "analyze", "fix"]
+    workflow_type: WorkflowType
 
     # Timestamps
     issue_created_at: Optional[datetime] = None
@@ -20,18 +29,14 @@ class WorkflowRunRecord(BaseModel):
     workflow_completed_at: Optional[datetime] = None
 
     # Triage results
-    triage_decision: Optional[
-        Literal["valid", "invalid", "duplicate", "needs_info"]
-    ] = None
+    triage_decision: Optional[TriageDecision] = None
     triage_reason: Optional[str] = None
     duplicate_of: Optional[int] = None
 
     # Analyze results
-    fix_decision: Optional[
-        Literal["auto_eligible", "manual_required", "comment_only"]
-    ] = None
-    priority: Optional[Literal["P0", "P1", "P2"]] = None
-    story_points: Optional[int] = None
+    fix_decision: Optional[FixDecision] = None
+    priority: Optional[Priority] = None
+    story_points: Optional[StoryPoints] = None
     assignee: Optional[str] = None
 
     # Fix results
@@ -44,5 +49,24 @@ class WorkflowRunRecord(BaseModel):
     output_tokens: int = 0
 
     def to_supabase_dict(self) -> dict:
-        """Convert to dict for Supabase insert."""
-        return self.model_dump(mode="json")
+        """Convert to dict for Supabase insert.
+
+        None values are omitted to keep the payload small; the matching
+        columns are nullable and default to NULL.
+        """
+        return self.model_dump(mode="json", exclude_none=True)
+
+    @classmethod
+    def to_supabase_rows(cls, records: list["WorkflowRunRecord"]) -> list[dict]:
+        """Convert a batch of records for a bulk Supabase insert.
+
+        Unlike to_supabase_dict(), None values are kept: PostgREST requires
+        every object in a bulk insert to have the same keys, and older
+        postgrest-py releases do not send a ?columns= union to paper over
+        it. The whole list is serialized in a single pydantic-core call.
+        """
+        return _RECORD_LIST_ADAPTER.dump_python(records, mode="json")
+
+
+# Serializes a whole batch of records in one pydantic-core call
+_RECORD_LIST_ADAPTER = TypeAdapter(list[WorkflowRunRecord])
@@ -1,7 +1,12 @@
 """Supabase storage for metrics."""
 
+import asyncio
+import atexit
+import gzip
 import logging
 import os
+import threading
+from functools import lru_cache
 from typing import Optional
 
 from beneissue.metrics.schemas import WorkflowRunRecord
@@ -9,15 +14,140 @@ from beneissue.metrics.schemas import WorkflowRunRecord
 logger = logging.getLogger("beneissue.metrics")
 
 
+# Connection pool for metrics inserts; idle connections are kept alive so
+# bursts of workflow runs reuse the same TLS session
+HTTP_MAX_CONNECTIONS = 60
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 60.0
+HTTP_TIMEOUT = 10.0
+
+# Request bodies at least this large are gzipped when SUPABASE_GZIP_REQUESTS
+# is enabled (the gateway in front of PostgREST must accept gzip bodies)
+GZIP_MIN_BYTES = 1024
+
+# Direct Postgres backend, enabled with BENEISSUE_METRICS_BACKEND=asyncpg
+METRICS_BACKEND_ENV = "BENEISSUE_METRICS_BACKEND"
+PG_POOL_MIN_SIZE = 2
+PG_POOL_MAX_SIZE = 10
+
+_RECORD_COLUMNS = tuple(WorkflowRunRecord.model_fields)
+
+
+def _gzip_request_body(request) -> None:
+    """httpx request hook that gzips large bodies, e.g. long triage reasons."""
+    body = request.content
+    if len(body) < GZIP_MIN_BYTES or "Content-Encoding" in request.headers:
+        return
+
+    import httpx
+
+    compressed = gzip.compress(body)
+    request.headers["Content-Encoding"] = "gzip"
+    request.headers["Content-Length"] = str(len(compressed))
+    request.stream = httpx.ByteStream(compressed)
+
+
+@lru_cache(maxsize=4)
+def _get_client(
+    url: str, key: str, ssl_verify: bool = True, gzip_requests: bool = False
+):
+    """Create a Supabase client once per connection setting and reuse it.
+
+    Sharing the client keeps its HTTP connection pool alive across records
+    instead of paying a new TCP+TLS handshake per workflow step.
+    """
+    import httpx
+    from supabase import ClientOptions, create_client
+
+    http_client = httpx.Client(
+        # Support SSL verification bypass for corporate proxies
+        verify=ssl_verify,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT),
+        event_hooks={"request": [_gzip_request_body]} if gzip_requests else None,
+    )
+    return create_client(url, key, options=ClientOptions(httpx_client=http_client))
+
+
+class _PostgresWriter:
+    """Insert workflow runs straight into Postgres through an asyncpg pool.
+
+    Meant for the Supavisor transaction pooler (port 6543), which cannot
+    keep prepared statements, so the statement cache is disabled. The pool
+    runs on a private event loop so the synchronous storage API can use it
+    from the collector's writer thread.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        self._dsn = dsn
+        self._loop = asyncio.new_event_loop()
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def insert(self, records: list[WorkflowRunRecord]) -> list[dict]:
+        """Insert records with one statement and return the inserted rows."""
+        with self._lock:
+            return self._loop.run_until_complete(self._insert(records))
+
+    def close(self) -> None:
+        """Close the pool and its event loop."""
+        with self._lock:
+            if self._pool is not None:
+                self._loop.run_until_complete(self._pool.close())
+                self._pool = None
+            self._loop.close()
+
+    async def _insert(self, records: list[WorkflowRunRecord]) -> list[dict]:
+        if self._pool is None:
+            import asyncpg
+
+            self._pool = await asyncpg.create_pool(
+                dsn=self._dsn,
+                min_size=PG_POOL_MIN_SIZE,
+                max_size=PG_POOL_MAX_SIZE,
+                statement_cache_size=0,
+            )
+
+        width = len(_RECORD_COLUMNS)
+        placeholders = []
+        args = []
+        for record in records:
+            row = record.model_dump()
+            start = len(args)
+            args.extend(row[column] for column in _RECORD_COLUMNS)
+            placeholders.append(
+                "(" + ", ".join(f"${start + i}" for i in range(1, width + 1)) + ")"
+            )
+
+        query = (
+            f"INSERT INTO workflow_runs ({', '.join(_RECORD_COLUMNS)}) "
+            f"VALUES {', '.join(placeholders)} RETURNING *"
+        )
+        rows = await self._pool.fetch(query, *args)
+        # Match the REST backend, which returns the UUID as a string
+        return [{**dict(row), "id": str(row["id"])} for row in rows]
+
+
+@lru_cache(maxsize=4)
+def _get_pg_writer(dsn: str) -> _PostgresWriter:
+    """Create one Postgres writer (and pool) per DSN and reuse it."""
+    return _PostgresWriter(dsn)
+
+
 class MetricsStorage:
     """Supabase storage for workflow metrics."""
 
     def __init__(self) -> None:
         self._client = None
+        self._pg_writer: Optional[_PostgresWriter] = None
 
     @property
     def client(self):
-        """Lazy-load Supabase client."""
+        """Lazy-load Supabase client (shared across storage instances)."""
         if self._client is None:
             url = os.environ.get("SUPABASE_URL")
             # Support both naming conventions
@@ -31,25 +161,68 @@ class MetricsStorage:
                 )
                 return None
 
-            from supabase import ClientOptions, create_client
-
-            # Support SSL verification bypass for corporate proxies
             ssl_verify = os.environ.get("SUPABASE_SSL_VERIFY", "true").lower()
-            if ssl_verify in ("false", "0", "no"):
-                import httpx
-
-                options = ClientOptions(httpx_client=httpx.Client(verify=False))
-                self._client = create_client(url, key, options=options)
-            else:
-                self._client = create_client(url, key)
+            gzip_requests = os.environ.get("SUPABASE_GZIP_REQUESTS", "false").lower()
+            self._client = _get_client(
+                url,
+                key,
+                ssl_verify not in ("false", "0", "no"),
+                gzip_requests in ("true", "1", "yes"),
+            )
 
         return self._client
 
+    @property
+    def uses_postgres(self) -> bool:
+        """Whether records are written over a direct Postgres connection."""
+        return os.environ.get(METRICS_BACKEND_ENV, "").lower() == "asyncpg"
+
+    @property
+    def pg_writer(self) -> Optional[_PostgresWriter]:
+        """Lazy-load the Postgres writer (shared across storage instances)."""
+        if self._pg_writer is None:
+            dsn = os.environ.get("SUPABASE_DB_URL")
+            if not dsn:
+                logger.warning("SUPABASE_DB_URL not set, metrics disabled")
+                return None
+            self._pg_writer = _get_pg_writer(dsn)
+
+        return self._pg_writer
+
+    def close(self) -> None:
+        """Close pooled connections and drop the cached clients."""
+        if self._client is not None:
+            http_client = self._client.options.httpx_client
+            if http_client is not None:
+                http_client.close()
+            self._client = None
+            _get_client.cache_clear()
+
+        if self._pg_writer is not None:
+            self._pg_writer.close()
+            self._pg_writer = None
+            _get_pg_writer.cache_clear()
+
     def save_run(self, record: WorkflowRunRecord) -> Optional[str]:
         """Save a workflow run record.
 
         Returns the record ID if successful, None otherwise.
         """
+        row = self.save_run_row(record)
+        return row["id"] if row else None
+
+    def save_run_row(self, record: WorkflowRunRecord) -> Optional[dict]:
+        """Save a workflow run record and return the inserted row.
+
+        The row comes back in the insert response, so callers that need
+        the stored values do not have to select it again.
+
+        Returns the inserted row if successful, None otherwise.
+        """
+        if self.uses_postgres:
+            rows = self._save_postgres([record])
+            return rows[0] if rows else None
+
         if self.client is None:
             logger.debug("Metrics storage not configured, skipping save")
             return None
@@ -66,16 +239,60 @@ class MetricsStorage:
                 .insert(supabase_dict)
                 .execute()
             )
-            record_id = result.data[0]["id"] if result.data else None
-            logger.info(f"Saved workflow run: {record_id}")
-            return record_id
+            row = result.data[0] if result.data else None
+            logger.info(f"Saved workflow run: {row['id'] if row else None}")
+            return row
         except Exception as e:
             logger.error(f"Failed to save workflow run: {e}")
             return None
 
+    def save_runs(self, records: list[WorkflowRunRecord]) -> list[str]:
+        """Save several workflow run records in a single insert.
+
+        Returns the IDs of the inserted records (empty on failure).
+        """
+        if not records:
+            return []
+
+        if self.uses_postgres:
+            return [row["id"] for row in self._save_postgres(records)]
+
+        if self.client is None:
+            logger.debug("Metrics storage not configured, skipping save")
+            return []
+
+        try:
+            rows = WorkflowRunRecord.to_supabase_rows(records)
+            result = self.client.table("workflow_runs").insert(rows).execute()
+            record_ids = [row["id"] for row in result.data or []]
+            logger.info(f"Saved {len(record_ids)} workflow run(s): {record_ids}")
+            return record_ids
+        except Exception as e:
+            logger.error(f"Failed to save workflow runs: {e}")
+            return []
+
+    def _save_postgres(self, records: list[WorkflowRunRecord]) -> list[dict]:
+        """Insert records through the Postgres writer, returning the rows."""
+        if self.pg_writer is None:
+            logger.debug("Metrics storage not configured, skipping save")
+            return []
+
+        try:
+            rows = self.pg_writer.insert(records)
+            logger.info(
+                f"Saved {len(rows)} workflow run(s): {[row['id'] for row in rows]}"
+            )
+            return rows
+        except Exception as e:
+            logger.error(f"Failed to save workflow runs: {e}")
+            return []
+
     @property
     def is_configured(self) -> bool:
         """Check if storage is configured."""
+        if self.uses_postgres:
+            return bool(os.environ.get("SUPABASE_DB_URL"))
+
         url = os.environ.get("SUPABASE_URL")
         key = os.environ.get("SUPABASE_SERVICE_KEY") or os.environ.get(
             "SUPABASE_SERVICE_ROLE_KEY"
@@ -93,4 +310,6 @@ def get_storage() -> MetricsStorage:
     global _storage
     if _storage is None:
         _storage = MetricsStorage()
+        # Registered before the collector's flush, so it runs after it
+        atexit.register(_storage.close)
     return _storage
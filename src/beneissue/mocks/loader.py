@@ -1,8 +1,9 @@
 """Mock data loader for dry-run mode."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
 from beneissue.mocks.defaults import DEFAULT_ANALYZE, DEFAULT_FIX, DEFAULT_TRIAGE
 
@@ -13,6 +14,20 @@ DEFAULTS: dict[str, dict[str, Any]] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _read_mock_file(mock_file: Path) -> Optional[dict[str, Any]]:
+    """Read and parse a user-defined mock file once per process.
+
+    Returns None if the file is missing or contains invalid JSON.
+    """
+    if not mock_file.exists():
+        return None
+    try:
+        return json.loads(mock_file.read_text())
+    except json.JSONDecodeError:
+        return None
+
+
 def load_mock(
     stage: Literal["triage", "analyze", "fix"],
     project_root: Path | None = None,
@@ -20,6 +35,7 @@ def load_mock(
     """Load mock data for a given stage.
 
     Checks for user-defined mock file first, falls back to defaults.
+    Parsed mock files are cached, so callers must not mutate the result.
 
     Args:
         stage: The workflow stage (triage, analyze, fix)
@@ -31,10 +47,8 @@ def load_mock(
     # Check for user-defined mock file
     if project_root:
         mock_file = project_root / ".claude" / "skills" / "beneissue" / "mocks" / f"{stage}.json"
-        if mock_file.exists():
-            try:
-                return json.loads(mock_file.read_text())
-            except json.JSONDecodeError:
-                pass  # Fall back to defaults
+        mock = _read_mock_file(mock_file)
+        if mock is not None:
+            return mock
 
     return DEFAULTS.get(stage, {})
@@ -144,13 +144,13 @@ def analyze_node(state: IssueState) -> dict:
             result, usage = _run_analysis(repo_path, prompt, repo_owner=repo_owner)
 
     # Add token usage to result for state storage
-    state_dict = usage.to_state_dict()
+    result = usage.with_state(result)
     logger.info(
         "[METRICS DEBUG] analyze_node returning usage_metadata: in_tokens=%d, out_tokens=%d",
-        state_dict.get("usage_metadata", {}).get("input_tokens", 0),
-        state_dict.get("usage_metadata", {}).get("output_tokens", 0),
+        result["usage_metadata"]["input_tokens"],
+        result["usage_metadata"]["output_tokens"],
     )
-    return {**result, **state_dict}
+    return result
 
 
 def _build_result(response: AnalyzeResult, repo_owner: str | None = None) -> dict:
@@ -1,6 +1,7 @@
 """Load preset node for test workflows."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from langchain_core.runnables import RunnableConfig
@@ -10,6 +11,15 @@ from beneissue.graph.state import IssueState
 # Default project path for testing
 DEFAULT_PROJECT_PATH = Path(__file__).parent.parent.parent.parent / "examples" / "calculator"
 
+# Directory containing preset JSON files
+PRESETS_DIR = DEFAULT_PROJECT_PATH / ".claude" / "skills" / "beneissue" / "tests" / "cases"
+
+
+@lru_cache(maxsize=1)
+def _preset_index() -> dict[str, Path]:
+    """Map preset names to their JSON files (scanned once per process)."""
+    return {f.stem: f for f in sorted(PRESETS_DIR.glob("*.json"))}
+
 
 def load_preset_node(state: IssueState, config: RunnableConfig) -> IssueState:
     """Load preset from JSON file based on configurable preset_name.
@@ -32,24 +42,14 @@ def load_preset_node(state: IssueState, config: RunnableConfig) -> IssueState:
     # Default to analyze-auto-eligible-typo if not specified
     preset_name = configurable.get("preset_name", "analyze-auto-eligible-typo")
 
-    # Build path to preset JSON file
+    # Look up preset JSON file
     project_root = DEFAULT_PROJECT_PATH
-    preset_path = (
-        project_root
-        / ".claude"
-        / "skills"
-        / "beneissue"
-        / "tests"
-        / "cases"
-        / f"{preset_name}.json"
-    )
-
-    if not preset_path.exists():
-        available = list(preset_path.parent.glob("*.json"))
-        available_names = [f.stem for f in available]
+    preset_path = _preset_index().get(preset_name)
+
+    if preset_path is None:
         raise FileNotFoundError(
-            f"Preset '{preset_name}' not found at {preset_path}. "
-            f"Available presets: {available_names}"
+            f"Preset '{preset_name}' not found at {PRESETS_DIR / f'{preset_name}.json'}. "
+            f"Available presets: {list(_preset_index())}"
         )
 
     # Load preset JSON
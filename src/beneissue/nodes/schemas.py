@@ -2,12 +2,14 @@
 
 from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TriageResult(BaseModel):
     """Triage node output schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     decision: Literal["valid", "invalid", "duplicate", "needs_info"]
     reason: str
     duplicate_of: Optional[int] = None
@@ -17,6 +19,8 @@ class TriageResult(BaseModel):
 class AnalyzeResult(BaseModel):
     """Analyze node output schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     summary: str  # 2-3 sentences: what, why, how
     affected_files: list[str]
     fix_decision: Literal["auto_eligible", "manual_required", "comment_only"]
@@ -31,6 +35,8 @@ class AnalyzeResult(BaseModel):
 class FixResult(BaseModel):
     """Fix node output schema from Claude Code."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     title: str  # Commit message title (50 chars max, imperative mood)
     description: str  # What was changed and why
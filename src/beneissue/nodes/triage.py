@@ -1,5 +1,6 @@
 """Triage node implementation."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from langchain_anthropic import ChatAnthropic
@@ -15,6 +16,17 @@ from beneissue.observability import log_node_event, traced_node
 from beneissue.prompts import load_prompt
 
 
+@lru_cache(maxsize=1)
+def _get_structured_llm():
+    """Get the triage LLM with structured output (built once, reused per call).
+
+    Reusing the client keeps its HTTP connection pool alive across issues.
+    Uses include_raw=True to get token usage from response metadata.
+    """
+    llm = ChatAnthropic(model=DEFAULT_TRIAGE_MODEL)
+    return llm.with_structured_output(TriageResult, include_raw=True)
+
+
 def _build_triage_prompt(state: IssueState) -> str:
     """Build the triage prompt with context."""
     # Read README from project root (default: cwd)
@@ -74,13 +86,9 @@ def triage_node(state: IssueState) -> dict:
             "labels_to_add": get_triage_labels().get(decision, []),
         }
 
-    llm = ChatAnthropic(model=DEFAULT_TRIAGE_MODEL)
-
     system_prompt = _build_triage_prompt(state)
 
-    # Use include_raw=True to get token usage from response metadata
-    structured_llm = llm.with_structured_output(TriageResult, include_raw=True)
-    result = structured_llm.invoke(
+    result = _get_structured_llm().invoke(
         [
             SystemMessage(content=system_prompt),
             HumanMessage(
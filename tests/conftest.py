@@ -1,7 +1,14 @@
 """Pytest configuration and fixtures."""
 
 import os
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Also loads pydantic and its compiled core once, before any test module
+from beneissue.metrics.schemas import WorkflowRunRecord
 
 
 def _load_env_file():
@@ -33,3 +40,73 @@ def _load_env_file():
 
 # Load .env before tests run
 _load_env_file()
+
+
+@pytest.fixture
+def supabase_env(monkeypatch):
+    """Set test Supabase credentials for the duration of a test."""
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "test-key")
+
+
+@pytest.fixture
+def no_supabase_env(monkeypatch):
+    """Remove any Supabase credentials (including ones loaded from .env)."""
+    for key in ("SUPABASE_URL", "SUPABASE_SERVICE_KEY", "SUPABASE_SERVICE_ROLE_KEY"):
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture
+def mock_create_client():
+    """Patch supabase.create_client with a pre-wired client mock.
+
+    ``mock_create_client.return_value`` is the client; its
+    ``table().insert().execute()`` chain returns one inserted row.
+    """
+    mock_client = MagicMock()
+    mock_client.table.return_value.insert.return_value.execute.return_value = (
+        MagicMock(data=[{"id": "test-uuid-123"}])
+    )
+    with patch("supabase.create_client", return_value=mock_client) as mock_create:
+        yield mock_create
+
+
+@pytest.fixture(scope="session")
+def now_utc() -> datetime:
+    """A single UTC timestamp shared by the whole test session."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def fresh_now() -> datetime:
+    """The current UTC time, for tests that need a real timestamp."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def minimal_record(now_utc) -> WorkflowRunRecord:
+    """A triage record with only the required fields (do not mutate)."""
+    return WorkflowRunRecord(
+        repo="owner/repo",
+        issue_number=123,
+        workflow_type="triage",
+        workflow_started_at=now_utc,
+        workflow_completed_at=now_utc,
+    )
+
+
+@pytest.fixture
+def triage_state(now_utc) -> dict:
+    """IssueState after a completed triage step."""
+    return {
+        "repo": "owner/repo",
+        "issue_number": 123,
+        "workflow_started_at": now_utc,
+        "triage_decision": "valid",
+        "triage_reason": "Valid bug report",
+        "usage_metadata": {
+            "input_tokens": 1000,
+            "output_tokens": 500,
+            "total_tokens": 1500,
+        },
+    }
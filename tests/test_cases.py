@@ -0,0 +1,66 @@
+"""Tests for policy test case files shipped with the calculator example."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+CASES_DIR = (
+    Path(__file__).parent.parent
+    / "examples"
+    / "calculator"
+    / ".claude"
+    / "skills"
+    / "beneissue"
+    / "tests"
+    / "cases"
+)
+CASE_FILES = sorted(CASES_DIR.glob("*.json"))
+CASE_NAMES = [f.stem for f in CASE_FILES]
+
+VALID_STAGES = {"triage", "analyze"}
+VALID_DECISIONS = {"valid", "invalid", "duplicate", "needs_info"}
+VALID_FIX_DECISIONS = {"auto_eligible", "manual_required", "comment_only"}
+
+
+@pytest.fixture(scope="session")
+def policy_cases() -> dict:
+    """Parse every case file once per session.
+
+    The parsed cases are shared by all tests, so tests must not modify them.
+    """
+    return {f.stem: json.loads(f.read_text()) for f in CASE_FILES}
+
+
+def test_example_cases_exist():
+    assert CASE_FILES, f"No test cases found in {CASES_DIR}"
+
+
+# One test per case file so failures are reported (and re-run with --lf) per case
+@pytest.mark.parametrize("case_name", CASE_NAMES)
+def test_case_file_is_valid(policy_cases, case_name: str):
+    test_case = policy_cases[case_name]
+
+    for key in ("name", "stage", "input", "expected"):
+        assert key in test_case, f"missing required key '{key}'"
+    assert test_case["stage"] in VALID_STAGES
+    assert "title" in test_case["input"]
+    assert "body" in test_case["input"]
+
+    expected = test_case["expected"]
+    if "decision" in expected:
+        assert expected["decision"] in VALID_DECISIONS
+    if "fix_decision" in expected:
+        assert expected["fix_decision"] in VALID_FIX_DECISIONS
+    # File prefix should match the stage it exercises
+    assert case_name.startswith(test_case["stage"])
+
+
+@pytest.mark.parametrize("case_name", CASE_NAMES)
+def test_case_existing_issues_are_well_formed(policy_cases, case_name: str):
+    existing_issues = policy_cases[case_name]["input"].get("existing_issues", [])
+    for issue in existing_issues:
+        assert isinstance(issue.get("number"), int)
+        assert issue.get("title")
+        # langsmith_eval.py formats every existing issue with its state
+        assert issue.get("state")
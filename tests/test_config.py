@@ -1,8 +1,11 @@
 """Tests for configuration loading."""
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 from beneissue.config import (
     DEFAULT_SCORE_THRESHOLD,
     get_available_assignee,
@@ -20,6 +23,32 @@ class TestLoadConfig:
 
             assert config.scoring.threshold == DEFAULT_SCORE_THRESHOLD
 
+    def test_defaults_shared_when_no_config(self, monkeypatch):
+        """Should reuse the same defaults instance when nothing overrides it."""
+        monkeypatch.delenv("BENEISSUE_SCORE_THRESHOLD", raising=False)
+        with TemporaryDirectory() as tmpdir:
+            assert load_config(Path(tmpdir)) is load_config(Path(tmpdir))
+
+    def test_defaults_are_frozen(self, monkeypatch):
+        """Should reject changes to the shared defaults instance."""
+        monkeypatch.delenv("BENEISSUE_SCORE_THRESHOLD", raising=False)
+        with TemporaryDirectory() as tmpdir:
+            config = load_config(Path(tmpdir))
+
+            with pytest.raises(FrozenInstanceError):
+                config.scoring.threshold = 0
+            assert load_config(Path(tmpdir)).scoring.threshold == (
+                DEFAULT_SCORE_THRESHOLD
+            )
+
+    def test_env_override_without_config_file(self, monkeypatch):
+        """Env override should apply even when no config file exists."""
+        monkeypatch.setenv("BENEISSUE_SCORE_THRESHOLD", "70")
+        with TemporaryDirectory() as tmpdir:
+            config = load_config(Path(tmpdir))
+
+            assert config.scoring.threshold == 70
+
     def test_load_from_file(self):
         """Should load config from file."""
         with TemporaryDirectory() as tmpdir:
@@ -105,7 +134,7 @@ team:
             assert len(config.team) == 2
             assert config.team[0].github_id == "alice"
             assert config.team[0].available is True
-            assert config.team[0].specialties == ["frontend", "react"]
+            assert config.team[0].specialties == ("frontend", "react")
             assert config.team[1].github_id == "bob"
             assert config.team[1].available is False
 
@@ -1,5 +1,8 @@
 """Tests for routing logic."""
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import pytest
 
 from beneissue.graph.routing import (
@@ -11,120 +14,72 @@ from beneissue.graph.routing import (
 )
 
 
-class TestRouteAfterIntake:
-    """Tests for route_after_intake function (daily limit check)."""
-
-    def test_limit_exceeded_goes_to_limit_exceeded(self):
-        state = {"daily_limit_exceeded": True}
-        assert route_after_intake(state) == "limit_exceeded"
-
-    def test_limit_not_exceeded_continues(self):
-        state = {"daily_limit_exceeded": False}
-        assert route_after_intake(state) == "continue"
-
-    def test_missing_limit_flag_continues(self):
-        state = {}
-        assert route_after_intake(state) == "continue"
-
-
-class TestRouteAfterTriage:
-    """Tests for route_after_triage function."""
-
-    def test_valid_goes_to_analyze(self):
-        state = {"triage_decision": "valid"}
-        assert route_after_triage(state) == "analyze"
-
-    def test_invalid_goes_to_apply_labels(self):
-        state = {"triage_decision": "invalid"}
-        assert route_after_triage(state) == "apply_labels"
-
-    def test_duplicate_goes_to_apply_labels(self):
-        state = {"triage_decision": "duplicate"}
-        assert route_after_triage(state) == "apply_labels"
-
-    def test_needs_info_goes_to_post_comment(self):
-        state = {"triage_decision": "needs_info"}
-        assert route_after_triage(state) == "post_comment"
-
-    def test_unknown_goes_to_apply_labels(self):
-        state = {"triage_decision": "unknown"}
-        assert route_after_triage(state) == "apply_labels"
-
-    def test_missing_decision_goes_to_apply_labels(self):
-        state = {}
-        assert route_after_triage(state) == "apply_labels"
-
-
-class TestRouteAfterAnalyze:
-    """Tests for route_after_analyze function."""
-
-    def test_auto_eligible_with_fix_command_goes_to_fix(self):
-        """auto_eligible + command=fix → fix (explicit approval)"""
-        state = {"fix_decision": "auto_eligible", "command": "fix"}
-        assert route_after_analyze(state) == "fix"
-
-    def test_auto_eligible_without_fix_command_goes_to_post_comment(self):
-        """auto_eligible without command=fix → post_comment (awaiting approval)"""
-        state = {"fix_decision": "auto_eligible", "command": "run"}
-        assert route_after_analyze(state) == "post_comment"
-
-    def test_auto_eligible_with_no_command_goes_to_post_comment(self):
-        """auto_eligible with no command → post_comment"""
-        state = {"fix_decision": "auto_eligible"}
-        assert route_after_analyze(state) == "post_comment"
-
-    def test_manual_required_goes_to_post_comment(self):
-        state = {"fix_decision": "manual_required"}
-        assert route_after_analyze(state) == "post_comment"
-
-    def test_comment_only_goes_to_post_comment(self):
-        state = {"fix_decision": "comment_only"}
-        assert route_after_analyze(state) == "post_comment"
-
-    def test_unknown_goes_to_apply_labels(self):
-        state = {"fix_decision": "unknown"}
-        assert route_after_analyze(state) == "apply_labels"
-
-    def test_missing_decision_goes_to_apply_labels(self):
-        state = {}
-        assert route_after_analyze(state) == "apply_labels"
-
-
-class TestRouteAfterFix:
-    """Tests for route_after_fix function."""
-
-    def test_success_goes_to_apply_labels(self):
-        state = {"fix_success": True}
-        assert route_after_fix(state) == "apply_labels"
-
-    def test_failure_goes_to_post_comment(self):
-        state = {"fix_success": False}
-        assert route_after_fix(state) == "post_comment"
-
-    def test_missing_goes_to_post_comment(self):
-        state = {}
-        assert route_after_fix(state) == "post_comment"
-
-
-class TestRouteAfterTriageTest:
-    """Tests for route_after_triage_test function (test workflow)."""
-
-    def test_valid_goes_to_analyze(self):
-        state = {"triage_decision": "valid"}
-        assert route_after_triage_test(state) == "analyze"
-
-    def test_invalid_goes_to_end(self):
-        state = {"triage_decision": "invalid"}
-        assert route_after_triage_test(state) == "__end__"
-
-    def test_duplicate_goes_to_end(self):
-        state = {"triage_decision": "duplicate"}
-        assert route_after_triage_test(state) == "__end__"
-
-    def test_needs_info_goes_to_end(self):
-        state = {"triage_decision": "needs_info"}
-        assert route_after_triage_test(state) == "__end__"
-
-    def test_missing_decision_goes_to_end(self):
-        state = {}
-        assert route_after_triage_test(state) == "__end__"
+@lru_cache(maxsize=None)
+def _state(**fields) -> MappingProxyType:
+    """Build a state with only the given fields (None means the key is absent).
+
+    States are cached and read-only, so equal states are built once and
+    shared safely; routers must only read from state.
+    """
+    return MappingProxyType(
+        {key: value for key, value in fields.items() if value is not None}
+    )
+
+
+# (state, expected next node) tables; each router is checked against its
+# whole table in one comparison, and a failure shows the full list diff
+_INTAKE_CASES = [
+    (_state(daily_limit_exceeded=True), True),
+    (_state(daily_limit_exceeded=False), False),
+    (_state(), False),
+]
+
+_TRIAGE_CASES = [
+    (_state(triage_decision="valid"), "analyze"),
+    (_state(triage_decision="invalid"), "apply_labels"),
+    (_state(triage_decision="duplicate"), "apply_labels"),
+    (_state(triage_decision="needs_info"), "post_comment"),
+    (_state(triage_decision="unknown"), "apply_labels"),
+    (_state(), "apply_labels"),
+]
+
+# auto_eligible only goes to fix with command=fix (explicit approval);
+# otherwise it waits for approval via post_comment
+_ANALYZE_CASES = [
+    (_state(fix_decision="auto_eligible", command="fix"), "fix"),
+    (_state(fix_decision="auto_eligible", command="run"), "post_comment"),
+    (_state(fix_decision="auto_eligible"), "post_comment"),
+    (_state(fix_decision="manual_required"), "post_comment"),
+    (_state(fix_decision="comment_only"), "post_comment"),
+    (_state(fix_decision="unknown"), "apply_labels"),
+    (_state(), "apply_labels"),
+]
+
+_FIX_CASES = [
+    (_state(fix_success=True), "apply_labels"),
+    (_state(fix_success=False), "post_comment"),
+    (_state(), "post_comment"),
+]
+
+_TRIAGE_TEST_CASES = [
+    (_state(triage_decision="valid"), "analyze"),
+    (_state(triage_decision="invalid"), "__end__"),
+    (_state(triage_decision="duplicate"), "__end__"),
+    (_state(triage_decision="needs_info"), "__end__"),
+    (_state(), "__end__"),
+]
+
+
+@pytest.mark.parametrize(
+    "router,cases",
+    [
+        pytest.param(route_after_intake, _INTAKE_CASES, id="intake"),
+        pytest.param(route_after_triage, _TRIAGE_CASES, id="triage"),
+        pytest.param(route_after_analyze, _ANALYZE_CASES, id="analyze"),
+        pytest.param(route_after_fix, _FIX_CASES, id="fix"),
+        pytest.param(route_after_triage_test, _TRIAGE_TEST_CASES, id="triage_test"),
+    ],
+)
+def test_router_matches_table(router, cases):
+    states, expected = zip(*cases)
+    assert list(map(router, states)) == list(expected)